@@ -6,7 +6,7 @@ import time
 import uuid
 from collections import defaultdict
 from datetime import datetime
-from typing import IO, Any, Mapping, NotRequired, Optional, TypedDict, cast
+from typing import IO, Any, Generator, Mapping, NotRequired, Optional, TypedDict, cast
 
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection, transaction
@@ -1712,6 +1712,32 @@ class EMPIService:
 
             return persons[0]
 
+    def _get_person_records_export_sql(self) -> sql.Composed:
+        return sql.SQL("""
+            select
+                p.uuid as person_id,
+                pr.source_person_id,
+                pr.data_source,
+                pr.first_name,
+                pr.last_name,
+                pr.sex,
+                pr.race,
+                pr.birth_date,
+                pr.death_date,
+                pr.social_security_number,
+                pr.address,
+                pr.city,
+                pr.state,
+                pr.zip_code,
+                pr.county,
+                pr.phone
+            from {person_record_table} pr
+            inner join {person_table} p on pr.person_id = p.id
+        """).format(
+            person_record_table=sql.Identifier(PersonRecord._meta.db_table),
+            person_table=sql.Identifier(Person._meta.db_table),
+        )
+
     def export_person_records(self, sink: str | IO[bytes]) -> None:
         """Export person records to S3 in CSV format.
 
@@ -1721,56 +1747,73 @@ class EMPIService:
         Raises:
             UploadError: If the upload fails.
         """
-        # Get all person records
-        with connection.cursor() as cursor:
-            person_records_sql = sql.SQL("""
-                select
-                    p.uuid as person_id,
-                    pr.source_person_id,
-                    pr.data_source,
-                    pr.first_name,
-                    pr.last_name,
-                    pr.sex,
-                    pr.race,
-                    pr.birth_date,
-                    pr.death_date,
-                    pr.social_security_number,
-                    pr.address,
-                    pr.city,
-                    pr.state,
-                    pr.zip_code,
-                    pr.county,
-                    pr.phone
-                from {person_record_table} pr
-                inner join {person_table} p on pr.person_id = p.id
-            """).format(
-                person_record_table=sql.Identifier(PersonRecord._meta.db_table),
-                person_table=sql.Identifier(Person._meta.db_table),
-            )
+        chunks = self.iter_person_records_csv()
 
-            cursor.execute(person_records_sql)
+        # Run the query before opening the sink, since closing the sink commits the upload
+        # and a failed query would otherwise leave an empty CSV behind
+        header = next(chunks)
 
-            self.logger.info(f"Retrieved {cursor.rowcount} person records")
+        with open_sink(sink) as f:
+            f.write(header)
 
-            # Write CSV content to FileProvider stream
-            with open_sink(sink) as f:
-                text_stream = io.TextIOWrapper(f, encoding="utf-8", newline="")
-                writer = csv.writer(text_stream, lineterminator="\n")
+            while True:
+                try:
+                    f.write(next(chunks))
+                except StopIteration as stop:
+                    row_count: int = stop.value
+                    break
 
-                # Write headers
-                column_names = [c.name for c in cursor.description]
-                writer.writerow(column_names)
+        self.logger.info(
+            f"Wrote {row_count} person records to {get_uri(sink) if isinstance(sink, str) else 'buffer'}"
+        )
 
-                # Write data
-                for row in cursor.fetchall():
-                    writer.writerow(row)
+    def iter_person_records_csv(
+        self, batch_size: int = 1000
+    ) -> Generator[bytes, None, int]:
+        """Export person records in CSV format as a stream of chunks.
 
-                text_stream.flush()
-                text_stream.detach()
+        Rows are read through a server-side cursor and encoded one batch at a time, so
+        neither the result set nor the CSV is held in memory in full. The first batch is
+        fetched before the header is yielded, so query errors surface on the first chunk.
 
-            self.logger.info(
-                f"Wrote {cursor.rowcount} person records to {get_uri(sink) if isinstance(sink, str) else 'buffer'}"
-            )
+        Args:
+            batch_size: Number of rows to fetch and encode per chunk.
+
+        Yields:
+            UTF-8 encoded CSV chunks: the header, then one chunk per batch of rows.
+
+        Returns:
+            The number of person records exported.
+        """
+        # Server-side cursor, so that rows are fetched from Postgres in batches
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(self._get_person_records_export_sql())
+            batch = cursor.fetchmany(batch_size)
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            row_count = 0
+
+            def flush() -> bytes:
+                chunk = buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                return chunk
+
+            # Write headers
+            writer.writerow([c.name for c in cursor.description])
+            yield flush()
+
+            # Write data
+            while batch:
+                writer.writerows(batch)
+                row_count += len(batch)
+                yield flush()
+                batch = cursor.fetchmany(batch_size)
+
+            self.logger.info(f"Retrieved {row_count} person records")
+
+            return row_count
 
     def export_potential_matches(
         self,
@@ -52,10 +52,10 @@ class K8sJobRunner(JobRunner):
             env["TUVA_EMPI_CONFIG_FILE"] = str(
                 Path(secret_volume.mount_path) / secret_volume.secret_key
             )
-        elif "TUVA_EMPI_CONFIG_AWS_SECRET_ARN" in os.environ:
-            env["TUVA_EMPI_CONFIG_AWS_SECRET_ARN"] = os.environ[
-                "TUVA_EMPI_CONFIG_AWS_SECRET_ARN"
-            ]
+        elif (
+            aws_secret_arn := os.environ.get("TUVA_EMPI_CONFIG_AWS_SECRET_ARN")
+        ) is not None:
+            env["TUVA_EMPI_CONFIG_AWS_SECRET_ARN"] = aws_secret_arn
 
         try:
             self.k8s.run_job(
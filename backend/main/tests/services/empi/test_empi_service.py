@@ -8,9 +8,10 @@ from datetime import timezone as tz
 from typing import IO, Any, Iterator, Mapping, Optional, cast
 from unittest.mock import MagicMock, patch
 
-from django.db import connection
+from django.db import ProgrammingError, connection, transaction
 from django.test import TestCase, TransactionTestCase
 from django.utils import timezone as django_tz
+from psycopg import sql
 
 from main.models import (
     Config,
@@ -4361,3 +4362,30 @@ class ExportPersonRecordsTestCase(TestCase):
             "phone",
         ]
         self.assertEqual(csv_content[0].split(","), expected_headers)
+
+    @patch("main.services.empi.empi_service.open_sink")
+    def test_export_query_error(self, mock_open_sink: MagicMock) -> None:
+        """Tests export doesn't open the sink when the export query fails."""
+        with (
+            patch.object(
+                self.empi,
+                "_get_person_records_export_sql",
+                return_value=sql.SQL("select * from missing_table"),
+            ),
+            self.assertRaises(ProgrammingError),
+            transaction.atomic(),
+        ):
+            self.empi.export_person_records("s3://tuva-health-example/test")
+
+        mock_open_sink.assert_not_called()
+
+    def test_iter_csv(self) -> None:
+        """Tests streamed export yields the header, then one chunk per batch of rows."""
+        chunks = list(self.empi.iter_person_records_csv(batch_size=1))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(chunks[0].startswith(b"person_id,source_person_id,"))
+        self.assertEqual(chunks[0].count(b"\n"), 1)
+
+        data_rows = sorted(chunk.decode("utf-8").split(",")[1] for chunk in chunks[1:])
+        self.assertEqual(data_rows, ["1", "2"])
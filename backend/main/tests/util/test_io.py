@@ -0,0 +1,65 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from main.util.io import get_uri, open_sink, open_source
+
+
+class OpenTestCase(unittest.TestCase):
+    def test_open_uri(self) -> None:
+        """Functions open_sink and open_source read and write fsspec URIs."""
+        uri = "memory://tuva-health-example/test.csv"
+
+        with open_sink(uri) as f:
+            f.write(b"a,b\n")
+
+        with open_source(uri) as f:
+            self.assertEqual(f.read(), b"a,b\n")
+
+    def test_open_sink_creates_parent_dirs(self) -> None:
+        """Function open_sink creates missing parent directories, like fsspec.open."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a" / "b" / "test.csv"
+
+            with open_sink(str(path)) as f:
+                f.write(b"a,b\n")
+
+            self.assertEqual(path.read_bytes(), b"a,b\n")
+
+    def test_open_source_uploaded_file(self) -> None:
+        """Function open_source rewinds uploaded files and leaves them open."""
+        upload = SimpleUploadedFile("person-records.csv", b"a,b\n")
+        upload.read()
+
+        with open_source(upload) as f:
+            self.assertEqual(f.read(), b"a,b\n")
+
+        self.assertFalse(upload.closed)
+
+    def test_open_sink_buffer(self) -> None:
+        """Function open_sink writes to buffers and leaves them open."""
+        buffer = io.BytesIO()
+
+        with open_sink(buffer) as f:
+            f.write(b"a,b\n")
+
+        self.assertFalse(buffer.closed)
+        self.assertEqual(buffer.getvalue(), b"a,b\n")
+
+
+class GetUriTestCase(unittest.TestCase):
+    def test_get_uri_str(self) -> None:
+        """Function get_uri returns string sources unchanged."""
+        self.assertEqual(
+            get_uri("s3://tuva-health-example/test.csv"),
+            "s3://tuva-health-example/test.csv",
+        )
+
+    def test_get_uri_uploaded_file(self) -> None:
+        """Function get_uri returns an upload URI for uploaded files."""
+        f = SimpleUploadedFile("person-records.csv", b"")
+
+        self.assertEqual(get_uri(f), "upload:person-records.csv")
@@ -0,0 +1,37 @@
+import unittest
+
+from main.views.pagination import PaginationMixin
+
+
+class PaginationMixinTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pagination = PaginationMixin()
+
+    def test_get_pagination_params_defaults(self) -> None:
+        """Method get_pagination_params falls back to page 1 and the default page size."""
+        self.assertEqual(
+            self.pagination.get_pagination_params({}),
+            (1, PaginationMixin.DEFAULT_PAGE_SIZE),
+        )
+
+    def test_get_pagination_params_clamp(self) -> None:
+        """Method get_pagination_params clamps page_size to MAX_PAGE_SIZE."""
+        self.assertEqual(
+            self.pagination.get_pagination_params({"page": 3, "page_size": 20}),
+            (3, 20),
+        )
+        self.assertEqual(
+            self.pagination.get_pagination_params({"page": 2, "page_size": 5000}),
+            (2, PaginationMixin.MAX_PAGE_SIZE),
+        )
+
+    def test_paginate_list(self) -> None:
+        """Method paginate_list drops the look-ahead item and reports navigation flags."""
+        self.assertEqual(
+            self.pagination.paginate_list([1, 2, 3], page=2, page_size=2),
+            ([1, 2], True, True),
+        )
+        self.assertEqual(
+            self.pagination.paginate_list([1, 2], page=1, page_size=2),
+            ([1, 2], False, False),
+        )
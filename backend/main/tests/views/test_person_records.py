@@ -1,6 +1,7 @@
 from typing import Any
 from unittest.mock import patch
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
@@ -166,6 +167,38 @@ class PersonRecordsTestCase(TestCase):
             },
         )
 
+    @patch("main.views.person_records.EMPIService")
+    def test_import_validation_multiple_sources(self, mock_empi: Any) -> None:
+        """Tests import_person_records rejects requests with both s3_uri and file."""
+        mock_empi_obj = mock_empi.return_value
+        mock_empi_obj.import_person_records.return_value = 1
+
+        url = reverse("import_person_records")
+
+        response = self.client.post(
+            url,
+            {
+                "s3_uri": "s3://tuva-health-example/test",
+                "file": SimpleUploadedFile(
+                    "test.csv", b"a,b\n", content_type="text/csv"
+                ),
+                "config_id": "cfg_1",
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertDictEqual(
+            response.json(),
+            {
+                "error": {
+                    "details": [
+                        {"message": "Provide only one of 's3_uri' or 'file', not both."}
+                    ],
+                    "message": "Validation failed",
+                }
+            },
+        )
+        mock_empi_obj.import_person_records.assert_not_called()
+
     @patch("main.views.person_records.EMPIService")
     def test_import_invalid_config_id(self, mock_empi: Any) -> None:
         """Tests import_person_records config_id validation fails."""
@@ -637,3 +670,23 @@ class ExportPersonRecordsTestCase(TestCase):
                 }
             },
         )
+
+    @patch("main.views.person_records.EMPIService")
+    def test_export_download(self, mock_empi: Any) -> None:
+        """Tests export_person_records streams a CSV download when no s3_uri is given."""
+        mock_empi_obj = mock_empi.return_value
+        mock_empi_obj.iter_person_records_csv.return_value = iter(
+            [b"person_id,source_person_id\n", b"p1,1\n"]
+        )
+
+        url = reverse("export_person_records")
+
+        response = self.client.post(url, {}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="person-record-export.csv"',
+        )
+        self.assertEqual(response.getvalue(), b"person_id,source_person_id\np1,1\n")
+        mock_empi_obj.export_person_records.assert_not_called()
@@ -1,8 +1,8 @@
 import io
-from contextlib import contextmanager
+from contextlib import AbstractContextManager
 from tempfile import SpooledTemporaryFile
-from typing import IO, Iterator
-from urllib.parse import urlunparse
+from types import TracebackType
+from typing import IO, Optional, cast
 
 import fsspec  # type: ignore[import-untyped]
 from django.core.files.uploadedfile import UploadedFile
@@ -11,25 +11,39 @@ DEFAULT_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE
 DEFAULT_MAX_TEMP_FILE_BUFFER_SIZE = 20 * 1024 * 1024  # 20 MiB
 
 
-@contextmanager
-def open_source(source: str | UploadedFile) -> Iterator[IO[bytes]]:
+class _Unmanaged(AbstractContextManager[IO[bytes]]):
+    """Context manager for a file whose lifecycle is managed elsewhere."""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self.f = f
+
+    def __enter__(self) -> IO[bytes]:
+        return self.f
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        # Don't close — lifecycle is managed by Django or the caller
+        return None
+
+
+def open_source(source: str | UploadedFile) -> AbstractContextManager[IO[bytes]]:
     if isinstance(source, str):
-        with fsspec.open(source, mode="rb") as f:
-            yield f
-    else:
-        source.seek(0)
-        yield source
-        # Don't close — Django manages lifecycle
+        # fsspec's OpenFile is itself a context manager that closes the file on exit
+        return cast(AbstractContextManager[IO[bytes]], fsspec.open(source, mode="rb"))
+
+    source.seek(0)
+    return _Unmanaged(cast(IO[bytes], source))
 
 
-@contextmanager
-def open_sink(sink: str | IO[bytes]) -> Iterator[IO[bytes]]:
+def open_sink(sink: str | IO[bytes]) -> AbstractContextManager[IO[bytes]]:
     if isinstance(sink, str):
-        with fsspec.open(sink, mode="wb") as f:
-            yield f
-    else:
-        yield sink
-        # Don't close — caller manages lifecycle
+        return cast(AbstractContextManager[IO[bytes]], fsspec.open(sink, mode="wb"))
+
+    return _Unmanaged(sink)
 
 
 def open_temp_file() -> SpooledTemporaryFile[bytes]:
@@ -40,4 +54,6 @@ def get_uri(file: str | UploadedFile) -> str:
     if isinstance(file, str):
         return file
 
-    return urlunparse(("upload", "", file.name, "", "", ""))
+    # Same result as urlunparse(("upload", "", file.name, "", "", "")) without the
+    # round trip through urllib. Django reduces upload names to a basename.
+    return f"upload:{file.name}"
@@ -9,6 +9,9 @@ from rest_framework.response import Response
 class PaginationMixin:
     """Mixin to add pagination functionality to views."""
 
+    # No per-instance state, so skip the instance __dict__
+    __slots__ = ()
+
     DEFAULT_PAGE_SIZE = 50
     MAX_PAGE_SIZE = 1000
 
@@ -38,18 +41,18 @@ class PaginationMixin:
             data (Dict[str, Any]): Mapping that may contain "page" and "page_size" keys.
 
         Returns:
-            tuple[int, int]: A (page, page_size) pair where `page` defaults to 1 if missing and `page_size` is clamped to at most MAX_PAGE_SIZE (defaults to DEFAULT_PAGE_SIZE if not provided).
+            tuple[int, int]: A (page, page_size) pair where `page` defaults to 1 if missing and `page_size` is clamped to at most MAX_PAGE_SIZE (defaults to DEFAULT_PAGE_SIZE if not provided). Values are expected to already be validated ints (see the calling views' serializers).
         """
         page = data.get("page", 1)
-        page_size = min(
-            data.get("page_size", self.DEFAULT_PAGE_SIZE), self.MAX_PAGE_SIZE
-        )
+        page_size = data.get("page_size", self.DEFAULT_PAGE_SIZE)
+        page_size = page_size if page_size < self.MAX_PAGE_SIZE else self.MAX_PAGE_SIZE
+
         return page, page_size
 
     def paginate_list(
         self, items: List[Any], page: int, page_size: int
-    ) -> Dict[str, Any]:
-        """Produce paginated items and pagination metadata for the given page.
+    ) -> tuple[List[Any], bool, bool]:
+        """Split fetched items into the items for the given page and its navigation flags.
 
         Parameters:
             items (List[Any]): Sequence of items for the requested page; may contain up to one extra item (page_size + 1) to indicate whether a next page exists.
@@ -57,24 +60,12 @@ class PaginationMixin:
             page_size (int): Maximum number of items to return for the page.
 
         Returns:
-            Dict[str, Any]: A dictionary with:
-                - "items": the slice of items for the page (at most `page_size` elements),
-                - "pagination": metadata containing `page`, `page_size`, `has_next`, `has_previous`, `next_page`, and `previous_page`.
+            tuple[List[Any], bool, bool]: A (page_items, has_next, has_previous) tuple where `page_items` holds at most `page_size` elements.
         """
         has_next = len(items) > page_size
-        has_previous = page > 1
-
-        return {
-            "items": items[0:page_size],
-            "pagination": {
-                "page": page,
-                "page_size": page_size,
-                "has_next": has_next,
-                "has_previous": has_previous,
-                "next_page": page + 1 if has_next else None,
-                "previous_page": page - 1 if has_previous else None,
-            },
-        }
+
+        # Only slice off the extra item when there is one, to avoid copying the whole page
+        return (items[:page_size] if has_next else items), has_next, page > 1
 
     def create_paginated_response(
         self,
@@ -96,12 +87,19 @@ class PaginationMixin:
                 - `{response_key}`: the sliced list of items for the current page.
                 - `pagination`: metadata with keys `page`, `page_size`, `has_next`, `has_previous`, `next_page`, and `previous_page`.
         """
-        paginated_data = self.paginate_list(items, page, page_size)
+        page_items, has_next, has_previous = self.paginate_list(items, page, page_size)
 
         return Response(
             {
-                response_key: paginated_data["items"],
-                "pagination": paginated_data["pagination"],
+                response_key: page_items,
+                "pagination": {
+                    "page": page,
+                    "page_size": page_size,
+                    "has_next": has_next,
+                    "has_previous": has_previous,
+                    "next_page": page + 1 if has_next else None,
+                    "previous_page": page - 1 if has_previous else None,
+                },
             },
             status=status.HTTP_200_OK,
         )
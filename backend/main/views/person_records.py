@@ -1,8 +1,8 @@
 import re
 from typing import Any, Mapping
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-from django.http import FileResponse
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework import serializers, status
 from rest_framework.decorators import api_view, parser_classes
@@ -14,28 +14,30 @@ from main.services.empi.empi_service import (
     EMPIService,
     InvalidPersonRecordFileFormat,
 )
-from main.util.io import open_temp_file
 from main.util.object_id import get_id, get_object_id, get_prefix, is_object_id
 from main.views.errors import validation_error_data
 from main.views.serializer import Serializer
 
+# "Bucket names can consist only of lowercase letters, numbers, dots (.), and hyphens (-)."
+# - https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
+_S3_BUCKET_RE = re.compile(r"[a-z0-9.-]+")
+
+_CONFIG_ID_PREFIX = get_prefix("Config") + "_"
+
 
 class S3URIValidatorMixin:
     """Mixin for validating S3 URIs."""
 
     def validate_s3_uri(self, value: str) -> str:
-        s3_uri_parsed = urlparse(value, allow_fragments=False)
+        # Reject anything that isn't an S3 URI before parsing it
+        if not value.startswith("s3://"):
+            raise serializers.ValidationError("Invalid S3 URI")
+
+        s3_uri_parsed = urlsplit(value, allow_fragments=False)
         s3_bucket = s3_uri_parsed.netloc
         s3_key = s3_uri_parsed.path.lstrip("/")
 
-        # "Bucket names can consist only of lowercase letters, numbers, dots (.), and hyphens (-)."
-        # - https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
-        if (
-            value.startswith("s3://")
-            and s3_uri_parsed.scheme == "s3"
-            and re.fullmatch(r"[a-z0-9.-]+", s3_bucket)
-            and s3_key
-        ):
+        if _S3_BUCKET_RE.fullmatch(s3_bucket) and s3_key:
             return value
         else:
             raise serializers.ValidationError("Invalid S3 URI")
@@ -47,15 +49,18 @@ class ImportPersonRecordsRequest(S3URIValidatorMixin, Serializer):
     config_id = serializers.CharField()
 
     def validate_config_id(self, value: str) -> str:
-        if value.startswith(get_prefix("Config") + "_") and is_object_id(value, "int"):
+        if value.startswith(_CONFIG_ID_PREFIX) and is_object_id(value, "int"):
             return value
         else:
             raise serializers.ValidationError("Invalid Config ID")
 
     def validate(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
-        if not data.get("s3_uri") and not data.get("file"):
+        s3_uri = data.get("s3_uri")
+        file = data.get("file")
+
+        if not s3_uri and not file:
             raise serializers.ValidationError("Must provide either 's3_uri' or 'file'.")
-        if data.get("s3_uri") and data.get("file"):
+        if s3_uri and file:
             raise serializers.ValidationError(
                 "Provide only one of 's3_uri' or 'file', not both."
             )
@@ -76,27 +81,24 @@ class ImportPersonRecordsResponse(Serializer):
 def import_person_records(request: Request) -> Response:
     """Import person records from an S3 object."""
     serializer = ImportPersonRecordsRequest(data=request.data)
-
-    if serializer.is_valid(raise_exception=True):
-        data = serializer.validated_data
-        empi = EMPIService()
-
-        try:
-            # FIXME: Check if config exists and return 400 error if not
-            source = data.get("s3_uri", data.get("file"))
-            config_id = get_id(data["config_id"])
-            job_id = empi.import_person_records(source, config_id)
-        except (FileNotFoundError, InvalidPersonRecordFileFormat) as e:
-            return Response(
-                validation_error_data(details=[str(e)]),
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
+    serializer.is_valid(raise_exception=True)
+
+    data = serializer.validated_data
+    empi = EMPIService()
+
+    try:
+        # FIXME: Check if config exists and return 400 error if not
+        # Validation guarantees exactly one source is set
+        source = data.get("s3_uri") or data["file"]
+        config_id = get_id(data["config_id"])
+        job_id = empi.import_person_records(source, config_id)
+    except (FileNotFoundError, InvalidPersonRecordFileFormat) as e:
         return Response(
-            {"job_id": get_object_id(job_id, "Job")}, status=status.HTTP_200_OK
+            validation_error_data(details=[str(e)]),
+            status=status.HTTP_400_BAD_REQUEST,
         )
 
-    return Response(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response({"job_id": get_object_id(job_id, "Job")}, status=status.HTTP_200_OK)
 
 
 class ExportPersonRecordsRequest(S3URIValidatorMixin, Serializer):
@@ -115,37 +117,32 @@ class ExportPersonRecordsRequest(S3URIValidatorMixin, Serializer):
     },
 )
 @api_view(["POST"])
-def export_person_records(request: Request) -> Response | FileResponse:
+def export_person_records(request: Request) -> Response | StreamingHttpResponse:
     """Export person records to S3 in CSV format."""
     serializer = ExportPersonRecordsRequest(data=request.data)
+    serializer.is_valid(raise_exception=True)
 
-    if serializer.is_valid(raise_exception=True):
-        data = serializer.validated_data
-        empi = EMPIService()
-
-        if s3_uri := data.get("s3_uri"):
-            try:
-                empi.export_person_records(s3_uri)
-
-                return Response({}, status=status.HTTP_200_OK)
-            # See: https://github.com/fsspec/s3fs/blob/main/s3fs/errors.py#L74-L79
-            except FileNotFoundError as e:
-                return Response(
-                    validation_error_data(details=[str(e)]),
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        else:
-            # TODO: It might be cleaner (and more performant) to have another method (e.g.
-            # get_person_records) that returns a generator so that we can use StreamingHttpResponse.
-            f = open_temp_file()
-            empi.export_person_records(f)
-            f.seek(0)
-
-            return FileResponse(
-                f,
-                as_attachment=True,
-                filename="person-record-export.csv",
-                content_type="text/csv",
+    data = serializer.validated_data
+    empi = EMPIService()
+
+    if s3_uri := data.get("s3_uri"):
+        try:
+            empi.export_person_records(s3_uri)
+
+            return Response({}, status=status.HTTP_200_OK)
+        # See: https://github.com/fsspec/s3fs/blob/main/s3fs/errors.py#L74-L79
+        except FileNotFoundError as e:
+            return Response(
+                validation_error_data(details=[str(e)]),
+                status=status.HTTP_400_BAD_REQUEST,
             )
+    else:
+        # Stream the CSV as it is produced rather than buffering it in a temp file first
+        response = StreamingHttpResponse(
+            empi.iter_person_records_csv(), content_type="text/csv"
+        )
+        response["Content-Disposition"] = (
+            'attachment; filename="person-record-export.csv"'
+        )
 
-    return Response(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return response
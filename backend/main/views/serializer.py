@@ -7,7 +7,8 @@ class Serializer(serializers.Serializer[Any]):
     def to_internal_value(self, data: Any) -> Any:
         """Check for unexpected fields before normal processing."""
         if isinstance(data, Mapping):
-            unexpected_fields = set(data.keys()) - set(self.fields.keys())
+            # Key views support set difference directly, avoiding two throwaway sets
+            unexpected_fields = data.keys() - self.fields.keys()
 
             if unexpected_fields:
                 raise serializers.ValidationError(